@@ -35,6 +35,20 @@ var crc16CcitTable = [256]CRC16{
 	0x6E17, 0x7E36, 0x4E55, 0x5E74, 0x2E93, 0x3EB2, 0x0ED1, 0x1EF0,
 }
 
+// Slicing-by-8 tables, entry [k][b] is the CRC contribution of byte b
+// followed by k zero bytes. First table is the regular CCITT table.
+var crc16CcitSlicingTable [8][256]CRC16
+
+func init() {
+	crc16CcitSlicingTable[0] = crc16CcitTable
+	for k := 1; k < 8; k++ {
+		for b := 0; b < 256; b++ {
+			prev := crc16CcitSlicingTable[k-1][b]
+			crc16CcitSlicingTable[k][b] = (prev << 8) ^ crc16CcitTable[uint8(prev>>8)]
+		}
+	}
+}
+
 type CRC16 uint16
 
 // Add a single byte to current CRC
@@ -46,8 +60,25 @@ func (crc *CRC16) Single(data byte) {
 
 // Add a slice of bytes to current CRC
 // and compute new CRC
+// Data is processed 8 bytes at a time (slicing-by-8), remaining bytes
+// are processed with the regular table. CRC is kept in a local variable
+// to avoid loading & storing through the pointer for every byte
 func (crc *CRC16) Block(block []byte) {
+	c := *crc
+	t := &crc16CcitSlicingTable
+	for len(block) >= 8 {
+		c = t[7][uint8(c>>8)^block[0]] ^
+			t[6][uint8(c)^block[1]] ^
+			t[5][block[2]] ^
+			t[4][block[3]] ^
+			t[3][block[4]] ^
+			t[2][block[5]] ^
+			t[1][block[6]] ^
+			t[0][block[7]]
+		block = block[8:]
+	}
 	for _, data := range block {
-		crc.Single(data)
+		c = (c << 8) ^ crc16CcitTable[uint8(c>>8)^data]
 	}
+	*crc = c
 }
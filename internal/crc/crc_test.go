@@ -11,3 +11,46 @@ func TestCcittSingle(t *testing.T) {
 	crc.Single(10)
 	assert.EqualValues(t, 0xA14A, crc)
 }
+
+func TestCcittBlock(t *testing.T) {
+	crc := CRC16(0)
+	crc.Block([]byte("123456789"))
+	assert.EqualValues(t, 0x31C3, crc)
+	// Computing in several blocks or byte by byte should give same result
+	crcSplit := CRC16(0)
+	crcSplit.Block([]byte("1234"))
+	crcSplit.Block([]byte("56789"))
+	assert.Equal(t, crc, crcSplit)
+	crcSingle := CRC16(0)
+	for _, b := range []byte("123456789") {
+		crcSingle.Single(b)
+	}
+	assert.Equal(t, crc, crcSingle)
+}
+
+func TestCcittBlockLong(t *testing.T) {
+	// Long inputs use slicing-by-8, compare with byte by byte computation
+	data := make([]byte, 1000)
+	for i := range data {
+		data[i] = byte(i*7 + 3)
+	}
+	for _, length := range []int{7, 8, 9, 15, 16, 17, 127 * 7, 1000} {
+		crc := CRC16(0)
+		crc.Block(data[:length])
+		crcSingle := CRC16(0)
+		for _, b := range data[:length] {
+			crcSingle.Single(b)
+		}
+		assert.Equal(t, crcSingle, crc, "length %v", length)
+	}
+}
+
+func BenchmarkCcittBlock(b *testing.B) {
+	// One full SDO sub-block (127 segments of 7 bytes)
+	data := make([]byte, 127*7)
+	crc := CRC16(0)
+	b.SetBytes(int64(len(data)))
+	for i := 0; i < b.N; i++ {
+		crc.Block(data)
+	}
+}
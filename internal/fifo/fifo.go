@@ -47,6 +47,8 @@ func (f *Fifo) GetOccupied() int {
 }
 
 // Write data to fifo
+// Data is copied by contiguous chunks (at most two when wrapping around)
+// and CRC is updated once per chunk instead of once per byte
 func (f *Fifo) Write(buffer []byte, crc *crc.CRC16) int {
 
 	if buffer == nil {
@@ -54,23 +56,26 @@ func (f *Fifo) Write(buffer []byte, crc *crc.CRC16) int {
 	}
 	writeCounter := 0
 
-	for _, element := range buffer {
-		writePosNext := f.writePos + 1
-		if writePosNext == f.readPos || (writePosNext == len(f.buffer) && f.readPos == 0) {
+	for writeCounter < len(buffer) {
+		// Contiguous free space, one byte is always kept free
+		end := len(f.buffer)
+		if f.readPos > f.writePos {
+			end = f.readPos - 1
+		} else if f.readPos == 0 {
+			end = len(f.buffer) - 1
+		}
+		if end <= f.writePos {
 			break
 		}
-		f.buffer[f.writePos] = element
-		writeCounter += 1
+		n := copy(f.buffer[f.writePos:end], buffer[writeCounter:])
 		if crc != nil {
-			crc.Single(element)
+			crc.Block(f.buffer[f.writePos : f.writePos+n])
 		}
-		if writePosNext == len(f.buffer) {
+		writeCounter += n
+		f.writePos += n
+		if f.writePos == len(f.buffer) {
 			f.writePos = 0
-
-		} else {
-			f.writePos += 1
 		}
-
 	}
 	return writeCounter
 
@@ -78,25 +83,22 @@ func (f *Fifo) Write(buffer []byte, crc *crc.CRC16) int {
 
 // Read data from fifo and return number of bytes read
 func (f *Fifo) Read(buffer []byte, eof *bool) int {
-	var readCounter int = 0
 	if buffer == nil {
 		return 0
 	}
 	if eof != nil {
 		*eof = false
 	}
-	if f.readPos == f.writePos || buffer == nil {
-		return 0
-	}
-	for index := range buffer {
-		if f.readPos == f.writePos {
-			break
+	readCounter := 0
+	// At most two contiguous chunks, before and after wrap around
+	for readCounter < len(buffer) && f.readPos != f.writePos {
+		end := f.writePos
+		if f.readPos > f.writePos {
+			end = len(f.buffer)
 		}
-		buffer[index] = f.buffer[f.readPos]
-
-		readCounter++
-		f.readPos++
-
+		n := copy(buffer[readCounter:], f.buffer[f.readPos:end])
+		readCounter += n
+		f.readPos += n
 		if f.readPos == len(f.buffer) {
 			f.readPos = 0
 		}
@@ -120,32 +122,35 @@ func (f *Fifo) AltBegin(offset int) int {
 	return offset - i
 }
 
+// Alternate finish, consumes data up to alternate read position
+// CRC is updated over the acknowledged data once per contiguous chunk
+// (at most two when wrapping around)
 func (f *Fifo) AltFinish(crc *crc.CRC16) {
 
 	if crc == nil {
 		f.readPos = f.altReadPos
 		return
 	}
-	for f.readPos != f.altReadPos {
-		crc.Single(f.buffer[f.readPos])
-		f.readPos++
-		if f.readPos == len(f.buffer) {
-			f.readPos = 0
-		}
+	if f.readPos > f.altReadPos {
+		crc.Block(f.buffer[f.readPos:])
+		f.readPos = 0
 	}
+	crc.Block(f.buffer[f.readPos:f.altReadPos])
+	f.readPos = f.altReadPos
 }
 
 func (f *Fifo) AltRead(buffer []byte) int {
 
-	readCounter := int(0)
-	for index := range buffer {
-		if f.altReadPos == f.writePos {
-			break
+	readCounter := 0
+	// At most two contiguous chunks, before and after wrap around
+	for readCounter < len(buffer) && f.altReadPos != f.writePos {
+		end := f.writePos
+		if f.altReadPos > f.writePos {
+			end = len(f.buffer)
 		}
-		buffer[index] = f.buffer[f.altReadPos]
-		readCounter++
-		f.altReadPos++
-
+		n := copy(buffer[readCounter:], f.buffer[f.altReadPos:end])
+		readCounter += n
+		f.altReadPos += n
 		if f.altReadPos == len(f.buffer) {
 			f.altReadPos = 0
 		}
@@ -3,6 +3,7 @@ package fifo
 import (
 	"testing"
 
+	"github.com/samsamfire/gocanopen/internal/crc"
 	"github.com/stretchr/testify/assert"
 )
 
@@ -25,6 +26,25 @@ func TestFifoWrite(t *testing.T) {
 	assert.Equal(t, 10, res)
 }
 
+func TestFifoWriteWrapAround(t *testing.T) {
+	fifo := NewFifo(10)
+	fifo.Write([]byte{1, 2, 3, 4, 5, 6, 7}, nil)
+	fifo.Read(make([]byte, 5), nil)
+	// Write wraps around end of internal buffer
+	crcFifo := crc.CRC16(0)
+	res := fifo.Write([]byte{8, 9, 10, 11, 12, 13, 14, 15}, &crcFifo)
+	assert.Equal(t, 7, res)
+	assert.Equal(t, 9, fifo.GetOccupied())
+	assert.Equal(t, 0, fifo.GetSpace())
+	crcExpected := crc.CRC16(0)
+	crcExpected.Block([]byte{8, 9, 10, 11, 12, 13, 14})
+	assert.Equal(t, crcExpected, crcFifo)
+	rxBuffer := make([]byte, 10)
+	res = fifo.Read(rxBuffer, nil)
+	assert.Equal(t, 9, res)
+	assert.Equal(t, []byte{6, 7, 8, 9, 10, 11, 12, 13, 14}, rxBuffer[:res])
+}
+
 func TestFifoRead(t *testing.T) {
 	fifo := NewFifo(100)
 	receive_buffer := make([]byte, 10)
@@ -58,3 +78,31 @@ func TestFifoAltRead(t *testing.T) {
 	assert.Equal(t, "1234567", string(rxBuffer))
 	assert.Equal(t, 93, fifo.AltGetOccupied())
 }
+
+func TestFifoAltReadWrapAround(t *testing.T) {
+	fifo := NewFifo(10)
+	fifo.Write([]byte{1, 2, 3, 4, 5, 6, 7}, nil)
+	fifo.Read(make([]byte, 5), nil)
+	fifo.Write([]byte{8, 9, 10, 11, 12}, nil)
+	fifo.AltBegin(0)
+	rxBuffer := make([]byte, 7)
+	res := fifo.AltRead(rxBuffer)
+	assert.Equal(t, 7, res)
+	assert.Equal(t, []byte{6, 7, 8, 9, 10, 11, 12}, rxBuffer)
+	assert.Equal(t, 0, fifo.AltGetOccupied())
+}
+
+func TestFifoAltFinishWrapAround(t *testing.T) {
+	fifo := NewFifo(10)
+	fifo.Write([]byte{1, 2, 3, 4, 5, 6, 7}, nil)
+	fifo.Read(make([]byte, 5), nil)
+	fifo.Write([]byte{8, 9, 10, 11, 12}, nil)
+	fifo.AltBegin(0)
+	fifo.AltRead(make([]byte, 6))
+	crcFifo := crc.CRC16(0)
+	fifo.AltFinish(&crcFifo)
+	crcExpected := crc.CRC16(0)
+	crcExpected.Block([]byte{6, 7, 8, 9, 10, 11})
+	assert.Equal(t, crcExpected, crcFifo)
+	assert.Equal(t, 1, fifo.GetOccupied())
+}
@@ -7,22 +7,38 @@ import (
 	"github.com/samsamfire/gocanopen/pkg/od"
 )
 
-// Helper function for reading a remote node entry as bytes
-func (node *BaseNode) readBytes(index any, subindex any) ([]byte, uint8, error) {
-
-	// Find corresponding Variable inside OD
-	// This will be used to determine information on the expected value
+// Helper function for finding the OD variable corresponding to a remote node entry
+// This will be used to determine information on the expected value
+func (node *BaseNode) lookup(index any, subindex any) (*od.Entry, *od.Variable, error) {
 	entry := node.od.Index(index)
 	odVar, err := entry.SubIndex(subindex)
 	if err != nil {
-		return nil, 0, err
+		return nil, nil, err
 	}
+	return entry, odVar, nil
+}
+
+// Helper function for reading the value of an OD variable from a remote node as bytes
+func (node *BaseNode) readVariable(entry *od.Entry, odVar *od.Variable) ([]byte, error) {
 	data := make([]byte, odVar.DataLength())
 	nbRead, err := node.ReadRaw(entry.Index, odVar.SubIndex, data)
+	if err != nil {
+		return nil, err
+	}
+	return data[:nbRead], nil
+}
+
+// Helper function for reading a remote node entry as bytes
+func (node *BaseNode) readBytes(index any, subindex any) ([]byte, uint8, error) {
+	entry, odVar, err := node.lookup(index, subindex)
+	if err != nil {
+		return nil, 0, err
+	}
+	data, err := node.readVariable(entry, odVar)
 	if err != nil {
 		return nil, 0, err
 	}
-	return data[:nbRead], odVar.DataType, nil
+	return data, odVar.DataType, nil
 }
 
 // Read an entry using a base sdo client
@@ -38,95 +54,114 @@ func (node *BaseNode) Read(index any, subindex any) (value any, e error) {
 }
 
 // Same as Read but enforces the returned type as uint64
+// The decoder is selected from the OD datatype before any transfer
+// so that a type mismatch does not cost an SDO exchange
 func (node *BaseNode) ReadUint(index any, subindex any) (value uint64, e error) {
-	data, dataType, err := node.readBytes(index, subindex)
+	entry, odVar, err := node.lookup(index, subindex)
 	if err != nil {
 		return 0, err
 	}
-	e = od.CheckSize(len(data), dataType)
-	if e != nil {
-		return 0, e
-	}
-	// Cast to correct type
-	switch dataType {
+	var decode func(data []byte) uint64
+	switch odVar.DataType {
 	case od.BOOLEAN, od.UNSIGNED8:
-		return uint64(data[0]), nil
+		decode = func(data []byte) uint64 { return uint64(data[0]) }
 	case od.UNSIGNED16:
-		return uint64(binary.LittleEndian.Uint16(data)), nil
+		decode = func(data []byte) uint64 { return uint64(binary.LittleEndian.Uint16(data)) }
 	case od.UNSIGNED32:
-		return uint64(binary.LittleEndian.Uint32(data)), nil
+		decode = func(data []byte) uint64 { return uint64(binary.LittleEndian.Uint32(data)) }
 	case od.UNSIGNED64:
-		return uint64(binary.LittleEndian.Uint64(data)), nil
+		decode = binary.LittleEndian.Uint64
 	default:
 		return 0, od.ErrTypeMismatch
 	}
+	data, err := node.readVariable(entry, odVar)
+	if err != nil {
+		return 0, err
+	}
+	e = od.CheckSize(len(data), odVar.DataType)
+	if e != nil {
+		return 0, e
+	}
+	return decode(data), nil
 }
 
 // Same as Read but enforces the returned type as int64
 func (node *BaseNode) ReadInt(index any, subindex any) (value int64, e error) {
-	data, dataType, err := node.readBytes(index, subindex)
+	entry, odVar, err := node.lookup(index, subindex)
 	if err != nil {
 		return 0, err
 	}
-	e = od.CheckSize(len(data), dataType)
-	if e != nil {
-		return 0, e
-	}
-	// Cast to correct type
-	switch dataType {
+	var decode func(data []byte) int64
+	switch odVar.DataType {
 	case od.BOOLEAN, od.INTEGER8:
-		return int64(data[0]), nil
+		decode = func(data []byte) int64 { return int64(data[0]) }
 	case od.INTEGER16:
-		return int64(int16(binary.LittleEndian.Uint16(data))), nil
+		decode = func(data []byte) int64 { return int64(int16(binary.LittleEndian.Uint16(data))) }
 	case od.INTEGER32:
-		return int64(int32(binary.LittleEndian.Uint32(data))), nil
+		decode = func(data []byte) int64 { return int64(int32(binary.LittleEndian.Uint32(data))) }
 	case od.INTEGER64:
-		return int64(binary.LittleEndian.Uint64(data)), nil
+		decode = func(data []byte) int64 { return int64(binary.LittleEndian.Uint64(data)) }
 	default:
 		return 0, od.ErrTypeMismatch
 	}
+	data, err := node.readVariable(entry, odVar)
+	if err != nil {
+		return 0, err
+	}
+	e = od.CheckSize(len(data), odVar.DataType)
+	if e != nil {
+		return 0, e
+	}
+	return decode(data), nil
 }
 
 // Same as Read but enforces the returned type as float
 func (node *BaseNode) ReadFloat(index any, subindex any) (value float64, e error) {
-	data, dataType, err := node.readBytes(index, subindex)
+	entry, odVar, err := node.lookup(index, subindex)
 	if err != nil {
 		return 0, err
 	}
-	e = od.CheckSize(len(data), dataType)
-	if e != nil {
-		return 0, e
-	}
-	// Cast to correct type
-	switch dataType {
+	var decode func(data []byte) float64
+	switch odVar.DataType {
 	case od.REAL32:
-		parsed := binary.LittleEndian.Uint32(data)
-		return float64(math.Float32frombits(parsed)), nil
+		decode = func(data []byte) float64 {
+			return float64(math.Float32frombits(binary.LittleEndian.Uint32(data)))
+		}
 	case od.REAL64:
-		parsed := binary.LittleEndian.Uint64(data)
-		return math.Float64frombits(parsed), nil
+		decode = func(data []byte) float64 {
+			return math.Float64frombits(binary.LittleEndian.Uint64(data))
+		}
 	default:
 		return 0, od.ErrTypeMismatch
 	}
+	data, err := node.readVariable(entry, odVar)
+	if err != nil {
+		return 0, err
+	}
+	e = od.CheckSize(len(data), odVar.DataType)
+	if e != nil {
+		return 0, e
+	}
+	return decode(data), nil
 }
 
 // Same as Read but enforces the returned type as string
 func (node *BaseNode) ReadString(index any, subindex any) (value string, e error) {
-	data, dataType, err := node.readBytes(index, subindex)
+	entry, odVar, err := node.lookup(index, subindex)
 	if err != nil {
 		return "", err
 	}
-	e = od.CheckSize(len(data), dataType)
-	if e != nil {
-		return "", e
-	}
-	// Cast to correct type
-	switch dataType {
+	switch odVar.DataType {
 	case od.OCTET_STRING, od.VISIBLE_STRING, od.UNICODE_STRING:
-		return string(data), nil
+		// String types have no size constraint
 	default:
 		return "", od.ErrTypeMismatch
 	}
+	data, err := node.readVariable(entry, odVar)
+	if err != nil {
+		return "", err
+	}
+	return string(data), nil
 }
 
 // Read an entry from a remote node
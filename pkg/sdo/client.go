@@ -562,34 +562,55 @@ func (client *SDOClient) downloadBlockInitiate() error {
 }
 
 // Helper function for downloading a sub-block
+// All the segments of the sub-block that are already available
+// in fifo are sent in one call, instead of one segment per call.
+// If a segment can't be sent (e.g. TX queue full), it is rolled back
+// and sent again on next call
 func (client *SDOClient) downloadBlock(bufferPartial bool, timerNext *uint32) error {
-	if client.fifo.AltGetOccupied() < 7 && bufferPartial {
-		// No data yet
-		return nil
-	}
-	client.blockSequenceNb++
-	client.txBuffer.Data[0] = client.blockSequenceNb
-	count := uint32(client.fifo.AltRead(client.txBuffer.Data[1:]))
-	client.blockNoData = uint8(7 - count)
-	client.sizeTransferred += count
-	if client.sizeIndicated > 0 && client.sizeTransferred > client.sizeIndicated {
-		client.sizeTransferred -= count
-		return AbortDataLong
-	}
-	if client.fifo.AltGetOccupied() == 0 && !bufferPartial {
-		if client.sizeIndicated > 0 && client.sizeTransferred < client.sizeIndicated {
-			return AbortDataShort
+	for client.state == stateDownloadBlkSubblockReq {
+		if client.fifo.AltGetOccupied() < 7 && bufferPartial {
+			// No data yet
+			return nil
 		}
-		client.txBuffer.Data[0] |= 0x80
-		client.finished = true
-		client.state = stateDownloadBlkSubblockRsp
-	} else if client.blockSequenceNb >= client.blockSize {
-		client.state = stateDownloadBlkSubblockRsp
-	} else if timerNext != nil {
-		*timerNext = 0
+		client.txBuffer.Data = [8]byte{0}
+		client.blockSequenceNb++
+		client.txBuffer.Data[0] = client.blockSequenceNb
+		count := uint32(client.fifo.AltRead(client.txBuffer.Data[1:]))
+		client.blockNoData = uint8(7 - count)
+		client.sizeTransferred += count
+		if client.sizeIndicated > 0 && client.sizeTransferred > client.sizeIndicated {
+			client.sizeTransferred -= count
+			return AbortDataLong
+		}
+		if client.fifo.AltGetOccupied() == 0 && !bufferPartial {
+			if client.sizeIndicated > 0 && client.sizeTransferred < client.sizeIndicated {
+				return AbortDataShort
+			}
+			client.txBuffer.Data[0] |= 0x80
+			client.finished = true
+			client.state = stateDownloadBlkSubblockRsp
+		} else if client.blockSequenceNb >= client.blockSize {
+			client.state = stateDownloadBlkSubblockRsp
+		} else if timerNext != nil {
+			*timerNext = 0
+		}
+		err := client.Send(client.txBuffer)
+		if err != nil {
+			// Timeout timer keeps running so that a bus that stays
+			// unavailable ends up in a timeout abort
+			client.blockSequenceNb--
+			client.sizeTransferred -= count
+			client.fifo.AltBegin(int(client.blockSequenceNb) * 7)
+			client.finished = false
+			client.state = stateDownloadBlkSubblockReq
+			if timerNext != nil {
+				*timerNext = 0
+			}
+			return nil
+		}
+		client.timeoutTimer = 0
 	}
-	client.timeoutTimer = 0
-	return client.Send(client.txBuffer)
+	return nil
 }
 
 // Helper function for end of block
@@ -0,0 +1,43 @@
+package sdo
+
+import (
+	"errors"
+	"testing"
+	"time"
+
+	canopen "github.com/samsamfire/gocanopen"
+	"github.com/stretchr/testify/assert"
+)
+
+// Bus on which every send fails, e.g. TX queue always full
+type failingBus struct{}
+
+func (bus *failingBus) Connect(...any) error { return nil }
+func (bus *failingBus) Disconnect() error    { return nil }
+func (bus *failingBus) Send(frame canopen.Frame) error {
+	return errors.New("no buffer space available")
+}
+func (bus *failingBus) Subscribe(callback canopen.FrameListener) error { return nil }
+
+func TestBlockDownloadSendFailureTimeout(t *testing.T) {
+	client, err := NewSDOClient(canopen.NewBusManager(&failingBus{}), nil, 0, 100, nil)
+	assert.Nil(t, err)
+	w, err := client.NewRawWriter(0x10, 0x2001, 0, true, 1000)
+	assert.Nil(t, err)
+	// Send block download initiate and simulate the server response
+	_, err = client.downloadMain(0, false, false, nil, nil, false)
+	assert.Nil(t, err)
+	client.Handle(canopen.Frame{DLC: 8, Data: [8]byte{0xA4, 0x01, 0x20, 0x00, 127}})
+
+	done := make(chan error)
+	go func() {
+		_, err := w.Write(make([]byte, 1000))
+		done <- err
+	}()
+	select {
+	case err = <-done:
+		assert.Equal(t, AbortTimeout, err)
+	case <-time.After(2 * time.Second):
+		t.Fatal("block download did not time out")
+	}
+}
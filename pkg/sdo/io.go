@@ -38,6 +38,24 @@ func (client *SDOClient) newRawReadWriter(nodeId uint8, index uint16, subindex u
 	return rw, err
 }
 
+// Return time elapsed since last process call in us and reset it
+// Real elapsed time is used because processing is not always periodic
+func elapsedUs(lastProcess *time.Time) uint32 {
+	now := time.Now()
+	elapsed := now.Sub(*lastProcess).Microseconds()
+	*lastProcess = now
+	return uint32(elapsed)
+}
+
+// Wait before next process call, unless client state machine
+// requested to be processed again immediately
+func waitProcess(timerNextUs uint32) {
+	if timerNextUs == 0 {
+		return
+	}
+	time.Sleep(time.Duration(defaultClientProcessPeriodUs) * time.Microsecond)
+}
+
 // Create a new raw SDO reader
 // This does not need an object dictionary but no checks will be made for the expected data
 // If blockEnabled is set to true, reading attempted using block transfer
@@ -75,9 +93,11 @@ func (client *SDOClient) NewRawWriter(nodeId uint8, index uint16, subindex uint8
 func (rw *sdoRawReadWriter) Read(b []byte) (n int, err error) {
 	client := rw.client
 	n = 0
+	lastProcess := time.Now()
 
 	for {
-		ret, err := client.upload(defaultClientProcessPeriodUs, false, nil, nil, nil)
+		timerNextUs := defaultClientProcessPeriodUs
+		ret, err := client.upload(elapsedUs(&lastProcess), false, nil, nil, &timerNextUs)
 		switch {
 		case err != nil:
 			return n, err
@@ -93,7 +113,7 @@ func (rw *sdoRawReadWriter) Read(b []byte) (n int, err error) {
 		if n >= len(b) {
 			return n, err
 		}
-		time.Sleep(time.Duration(defaultClientProcessPeriodUs) * time.Microsecond)
+		waitProcess(timerNextUs)
 	}
 }
 
@@ -137,13 +157,15 @@ func (rw *sdoRawReadWriter) Write(b []byte) (n int, err error) {
 	if n < len(b) {
 		bufferPartial = true
 	}
+	lastProcess := time.Now()
 	for {
+		timerNextUs := defaultClientProcessPeriodUs
 		ret, err := client.downloadMain(
-			defaultClientProcessPeriodUs,
+			elapsedUs(&lastProcess),
 			false,
 			bufferPartial,
 			&nUint32,
-			nil,
+			&timerNextUs,
 			false,
 		)
 		switch {
@@ -158,7 +180,7 @@ func (rw *sdoRawReadWriter) Write(b []byte) (n int, err error) {
 		case ret == success:
 			return int(nUint32), err
 		}
-		time.Sleep(time.Duration(defaultClientProcessPeriodUs) * time.Microsecond)
+		waitProcess(timerNextUs)
 	}
 }
 
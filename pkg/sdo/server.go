@@ -87,7 +87,8 @@ func (server *SDOServer) Handle(frame canopen.Frame) {
 					// All segments in sub block transferred
 					state = stateDownloadBlkSubblockRsp
 					log.Debugf("[SERVER][RX] BLOCK DOWNLOAD SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, frame.Data)
-				} else {
+				} else if log.IsLevelEnabled(log.DebugLevel) {
+					// Called for every segment, avoid formatting arguments if not needed
 					log.Debugf("[SERVER][RX] BLOCK DOWNLOAD SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, frame.Data)
 				}
 				// If duplicate or sequence didn't start ignore, otherwise
@@ -708,45 +709,66 @@ func (server *SDOServer) Process(
 			server.state = stateUploadBlkInitiateReq2
 
 		case stateUploadBlkSubblockSreq:
-			// Write header & gend current count
-			server.blockSequenceNb += 1
-			server.txBuffer.Data[0] = server.blockSequenceNb
-			count := server.bufWriteOffset - server.bufReadOffset
-			// Check if last segment
-			if count < 7 || (server.finished && count == 7) {
-				server.txBuffer.Data[0] |= 0x80
-			} else {
-				count = 7
-			}
-			copy(server.txBuffer.Data[1:], server.buffer[server.bufReadOffset:server.bufReadOffset+count])
-			server.bufReadOffset += count
-			server.blockNoData = byte(7 - count)
-			server.sizeTransferred += count
-			// Check if too short or too large in last segment
-			if server.sizeIndicated > 0 {
-				if server.sizeTransferred > server.sizeIndicated {
-					abortCode = AbortDataLong
-					server.state = stateAbort
-					break
-				} else if server.bufReadOffset == server.bufWriteOffset && server.sizeTransferred < server.sizeIndicated {
-					abortCode = AbortDataShort
-					server.state = stateAbort
-					break
+			// Send all the segments of the sub-block in one go
+			for server.state == stateUploadBlkSubblockSreq {
+				server.txBuffer.Data = [8]byte{0}
+				// Write header & gend current count
+				server.blockSequenceNb += 1
+				server.txBuffer.Data[0] = server.blockSequenceNb
+				count := server.bufWriteOffset - server.bufReadOffset
+				// Check if last segment
+				if count < 7 || (server.finished && count == 7) {
+					server.txBuffer.Data[0] |= 0x80
+				} else {
+					count = 7
 				}
-			}
-			// Check if last segment or all segments in current block transferred
-			if server.bufWriteOffset == server.bufReadOffset || server.blockSequenceNb >= server.blockSize {
-				server.state = stateUploadBlkSubblockCrsp
-				log.Debugf("[SERVER][TX] BLOCK UPLOAD END SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, server.txBuffer.Data)
-			} else {
-				log.Debugf("[SERVER][TX] BLOCK UPLOAD SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, server.txBuffer.Data)
-				if timerNextUs != nil {
-					*timerNextUs = 0
+				copy(server.txBuffer.Data[1:], server.buffer[server.bufReadOffset:server.bufReadOffset+count])
+				server.bufReadOffset += count
+				server.blockNoData = byte(7 - count)
+				server.sizeTransferred += count
+				// Check if too short or too large in last segment
+				if server.sizeIndicated > 0 {
+					if server.sizeTransferred > server.sizeIndicated {
+						abortCode = AbortDataLong
+						server.state = stateAbort
+						break
+					} else if server.bufReadOffset == server.bufWriteOffset && server.sizeTransferred < server.sizeIndicated {
+						abortCode = AbortDataShort
+						server.state = stateAbort
+						break
+					}
+				}
+				// Check if last segment or all segments in current block transferred
+				if server.bufWriteOffset == server.bufReadOffset || server.blockSequenceNb >= server.blockSize {
+					server.state = stateUploadBlkSubblockCrsp
+					log.Debugf("[SERVER][TX] BLOCK UPLOAD END SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, server.txBuffer.Data)
+				} else {
+					if log.IsLevelEnabled(log.DebugLevel) {
+						// Called for every segment, avoid formatting arguments if not needed
+						log.Debugf("[SERVER][TX] BLOCK UPLOAD SUB-BLOCK | x%x:x%x %v", server.index, server.subindex, server.txBuffer.Data)
+					}
+					if timerNextUs != nil {
+						*timerNextUs = 0
+					}
+				}
+				// Send & reset timer
+				if err := server.Send(server.txBuffer); err != nil {
+					// Segment not sent (e.g. TX queue full), roll it back
+					// and send it again on next call. Timer is not reset
+					// so that a bus that stays unavailable ends in a timeout
+					server.blockSequenceNb -= 1
+					server.bufReadOffset -= count
+					server.sizeTransferred -= count
+					// All segments sent so far were full
+					server.blockNoData = 0
+					server.state = stateUploadBlkSubblockSreq
+					if timerNextUs != nil {
+						*timerNextUs = 0
+					}
+					break
 				}
+				server.timeoutTimer = 0
 			}
-			// Reset timer & send
-			server.timeoutTimer = 0
-			server.Send(server.txBuffer)
 
 		case stateUploadBlkEndSreq:
 			server.txBuffer.Data[0] = 0xC1 | (server.blockNoData << 2)
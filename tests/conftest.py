@@ -1,24 +1,66 @@
 import pytest
 import logging
 import pathlib
+import time
+from typing import Dict
 
 import canopen
 
-EDS_PATH = str(
-    pathlib.Path(__file__).parent.absolute().parent.joinpath("pkg/od/base.eds")
-)
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+EDS_PATH = str(_ROOT / "pkg/od/base.eds")
 TEST_ID = 0x10
+# Maximum time to wait for the go node under test to answer
+READY_TIMEOUT_S = 30.0
+# Default channel for each supported transport
+TRANSPORT_CHANNELS = {
+    "virtualcan": "localhost:18889",
+    "socketcan": "vcan0",
+}
+# OD entries rewound by the savepoint fixture, in restore order.
+# Synchronous counter overflow can only be written while the cycle period is 0,
+# so the period is cleared first and restored last
+SAVEPOINT_ENTRIES = [
+    "COB-ID SYNC message",
+    "Synchronous counter overflow value",
+    "Communication cycle period",
+]
 
 logger = logging.getLogger(__name__)
 
 
+def wait_until_ready(node: canopen.RemoteNode, timeout: float = READY_TIMEOUT_S):
+    """Poll the node under test until it answers SDO requests"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            node.sdo.upload(0x1000, 0x0)
+            return
+        except canopen.SdoCommunicationError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--transport",
+        default="virtualcan",
+        choices=list(TRANSPORT_CHANNELS),
+        help="CAN interface used to reach the go node under test",
+    )
+
+
+# Session fixtures are created once per process. When running with pytest-xdist,
+# each worker needs its own virtualcan channel and go node, e.g. derived from
+# os.environ["PYTEST_XDIST_WORKER"], as all workers would share the same node otherwise
 @pytest.fixture(scope="session")
-def network():
+def network(request: pytest.FixtureRequest):
+    transport = request.config.getoption("--transport")
     network = canopen.Network()
     network.connect(
-        interface="virtualcan",
-        channel="localhost:18889",
-        receive_own_messages=True,
+        interface=transport,
+        channel=TRANSPORT_CHANNELS[transport],
+        receive_own_messages=False,
     )
     yield network
 
@@ -28,4 +70,31 @@ def node(network) -> canopen.RemoteNode:
     if TEST_ID in network:
         del network[TEST_ID]
     node = network.add_node(TEST_ID, EDS_PATH)
+    wait_until_ready(node)
+    yield node
+
+
+def record_savepoint(node: canopen.RemoteNode) -> Dict[str, int]:
+    """Read the current value of the savepoint OD entries"""
+    return {name: node.sdo[name].raw for name in SAVEPOINT_ENTRIES}
+
+
+def restore_savepoint(node: canopen.RemoteNode, saved: Dict[str, int]):
+    """Write back values returned by record_savepoint"""
+    node.sdo["Communication cycle period"].raw = 0
+    # A SYNC producer can't change its COB-ID, stop producing first
+    node.sdo["COB-ID SYNC message"].raw = saved["COB-ID SYNC message"] & ~(1 << 30)
+    for name in SAVEPOINT_ENTRIES:
+        node.sdo[name].raw = saved[name]
+
+
+@pytest.fixture
+def savepoint(node: canopen.RemoteNode) -> canopen.RemoteNode:
+    """Record OD entries mutated by a test and restore them afterwards"""
+    saved = record_savepoint(node)
     yield node
+    # SDO server is only processed in PRE-OPERATIONAL and OPERATIONAL
+    if node.nmt.state not in ("PRE-OPERATIONAL", "OPERATIONAL"):
+        logger.warning(f"node in {node.nmt.state}, skipping OD restore")
+        return
+    restore_savepoint(node, saved)
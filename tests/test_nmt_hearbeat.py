@@ -1,6 +1,8 @@
 import pytest
 import canopen
 from canopen import nmt
+from collections import deque
+import threading
 import time
 
 
@@ -11,6 +13,23 @@ def prepared_node(node: canopen.RemoteNode) -> canopen.RemoteNode:
     yield node
 
 
+def wait_for_state(nmt_master: nmt.NmtMaster, target: str, timeout: float = 3.0):
+    """Wait for heartbeats until node reports target state or timeout expires"""
+    deadline = time.monotonic() + timeout
+    state = None
+    while time.monotonic() < deadline:
+        try:
+            state = nmt_master.wait_for_heartbeat(
+                timeout=max(0.01, deadline - time.monotonic())
+            )
+        except nmt.NmtError:
+            # No heartbeat yet, e.g. node still resetting
+            continue
+        if state == target:
+            return state
+    raise AssertionError(f"did not reach {target}, last state was {state}")
+
+
 def test_nmt_stop(prepared_node: canopen.RemoteNode):
     prepared_node.nmt.state = "STOPPED"
     time.sleep(0.2)  # Let the time for the node to actually stop
@@ -34,36 +53,37 @@ def test_nmt_pre_operational(prepared_node: canopen.RemoteNode):
 def test_nmt_reset_comm(prepared_node: canopen.RemoteNode):
     prepared_node.nmt.state = "RESET COMMUNICATION"
     # give time for the application to restart
-    for _ in range(3):
-        state = prepared_node.nmt.wait_for_heartbeat(timeout=1.0)
-    assert state == "OPERATIONAL"
+    assert wait_for_state(prepared_node.nmt, "OPERATIONAL") == "OPERATIONAL"
 
 
 def test_nmt_reset_node(prepared_node: canopen.RemoteNode):
     prepared_node.nmt.state = "RESET"
-    for _ in range(3):
-        state = prepared_node.nmt.wait_for_heartbeat(timeout=1.0)
-    assert state == "OPERATIONAL"
-    time.sleep(0.2)
+    assert wait_for_state(prepared_node.nmt, "OPERATIONAL") == "OPERATIONAL"
 
 
 def test_heartbeat_time_producer(node: canopen.RemoteNode):
-    global counter
-    counter = 0
+    NB_HEARTBEATS = 3
+    timestamps = deque()
+    received = threading.Event()
 
     def hb_callback(*args):
-        global counter
-        counter += 1
+        timestamps.append(time.monotonic())
+        if len(timestamps) > NB_HEARTBEATS:
+            received.set()
 
-    node.sdo["Producer heartbeat time"].raw = 100
     node.network.subscribe(node.id + 0x700, hb_callback)
-    counter = 0
-    time.sleep(1)
-    assert 9 <= counter <= 11
-    node.sdo["Producer heartbeat time"].raw = 500
-    counter = 0
-    time.sleep(1.0)
-    assert 2 <= counter <= 3
+    try:
+        for period_ms in [100, 500]:
+            node.sdo["Producer heartbeat time"].raw = period_ms
+            timestamps.clear()
+            received.clear()
+            assert received.wait(timeout=(NB_HEARTBEATS + 2) * period_ms / 1000)
+            # First interval can still be from previous period, skip it
+            received_at = list(timestamps)[1:]
+            deltas = [b - a for a, b in zip(received_at, received_at[1:])]
+            assert deltas == pytest.approx([period_ms / 1000] * len(deltas), abs=0.03)
+    finally:
+        node.network.unsubscribe(node.id + 0x700, hb_callback)
 
 
 def test_disable_heartbeat(node: canopen.RemoteNode):
@@ -29,34 +29,44 @@ def node_configured(node: canopen.RemoteNode) -> canopen.RemoteNode:
     yield node
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def first_tpdo(node_configured) -> Map:
     return node_configured.tpdo[1]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def first_rpdo(node_configured) -> Map:
     return node_configured.rpdo[1]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def first_pdos(first_rpdo, first_tpdo) -> List[Map]:
     return [first_rpdo, first_tpdo]
 
 
-def test_map_pdo(node_configured):
+# PDO fixtures are shared by the whole module, put them back in a known state
+def _reset(pdo: Map):
+    pdo.clear()
+    pdo.trans_type = 1
+    pdo.enabled = False
+    pdo.cob_id = pdo.predefined_cob_id
+    pdo.inhibit_time = 0
+    pdo.event_timer = 0
+
+
+@pytest.mark.parametrize("variable", VARIABLES_TO_MAP)
+def test_map_pdo(node_configured, variable: str):
     for pdo in node_configured.pdo.values():
-        for variable in VARIABLES_TO_MAP:
-            pdo.clear()
-            pdo.add_variable(f"{variable} value")
-            pdo.save()
-            pdo.read()
-            assert pdo[f"{variable} value"] is not None
+        pdo.clear()
+        pdo.add_variable(f"{variable} value")
+        pdo.save()
+        pdo.read()
+        assert pdo[f"{variable} value"] is not None
 
 
 def test_map_pdo_multiple(first_pdos: List[Map]):
     for pdo in first_pdos:
-        pdo.clear()
+        _reset(pdo)
         for _ in range(8):
             pdo.add_variable("UNSIGNED8 value")
         pdo.save()
@@ -72,6 +82,7 @@ def test_map_pdo_multiple(first_pdos: List[Map]):
 
 def test_disable_pdo(first_rpdo: Map, first_tpdo: Map):
     for pdo in [first_tpdo, first_rpdo]:
+        _reset(pdo)
         pdo.enabled = False
         pdo.save()
         pdo.read()
@@ -79,6 +90,7 @@ def test_disable_pdo(first_rpdo: Map, first_tpdo: Map):
 
 
 def test_map_pdo_invalid_length(first_tpdo: Map):
+    _reset(first_tpdo)
     first_tpdo.add_variable("UNSIGNED64 value")
     first_tpdo.add_variable("UNSIGNED8 value")
     with pytest.raises(canopen.SdoAbortedError, match="length exceeded"):
@@ -86,13 +98,14 @@ def test_map_pdo_invalid_length(first_tpdo: Map):
 
 
 def test_map_pdo_not_mappable_var(first_tpdo: Map):
+    _reset(first_tpdo)
     first_tpdo.add_variable("DOMAIN value")
     with pytest.raises(canopen.SdoAbortedError, match="cannot be mapped"):
         first_tpdo.save()
 
 
 def test_tpdo_transmission(first_tpdo: Map):
-    first_tpdo.clear()
+    _reset(first_tpdo)
     first_tpdo.save()
     first_tpdo.add_variable("UNSIGNED64 value")
     first_tpdo.trans_type = 1
@@ -102,7 +115,7 @@ def test_tpdo_transmission(first_tpdo: Map):
 
 
 def test_rpdo_receive(node_configured: canopen.RemoteNode, first_rpdo: Map):
-    first_rpdo.clear()
+    _reset(first_rpdo)
     first_rpdo.add_variable("REAL64 value")
     first_rpdo.trans_type = 1
     first_rpdo.enabled = True
@@ -110,32 +123,61 @@ def test_rpdo_receive(node_configured: canopen.RemoteNode, first_rpdo: Map):
     first_rpdo.save()
     first_rpdo["REAL64 value"].raw = 1.554
     first_rpdo.transmit()
-    time.sleep(0.2)
-    assert node_configured.sdo["REAL64 value"].raw == 1.554
+    for _ in range(20):
+        if node_configured.sdo["REAL64 value"].raw == 1.554:
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("RPDO not received")
 
 
-def test_rpdo_receive_consistency(node_configured: canopen.RemoteNode, first_rpdo: Map):
-    first_rpdo.clear()
-    first_rpdo.add_variable("INTEGER64 value")
-    first_rpdo.trans_type = 1
-    first_rpdo.enabled = True
-    first_rpdo.cob_id = 0x310
-    first_rpdo.save()
-    first_rpdo["INTEGER64 value"].raw = 8989
-    first_rpdo.start(period=0.01)
-    time.sleep(0.1)
-    for i in range(100):
-        first_rpdo["INTEGER64 value"].raw = 1_111_111
-        first_rpdo.update()
-        sdo_raw = node_configured.sdo["INTEGER64 value"].raw
-        assert sdo_raw == 1_111_111 or sdo_raw == 8989
+def test_rpdo_receive_consistency(
+    node_configured: canopen.RemoteNode, first_rpdo: Map, first_tpdo: Map
+):
+    received_values = []
+
+    def tpdo_receiver(map: Map):
+        received_values.append(map["INTEGER64 value"].raw)
+
+    # Start from a known value so the tpdo never mirrors a stale one
+    node_configured.sdo["INTEGER64 value"].raw = 8989
+    # Mirror the rpdo value with an event driven tpdo instead of reading it via SDO
+    _reset(first_tpdo)
+    first_tpdo.add_variable("INTEGER64 value")
+    first_tpdo.trans_type = 255
+    first_tpdo.event_timer = 10
+    first_tpdo.enabled = True
+    first_tpdo.save()
+    first_tpdo.add_callback(tpdo_receiver)
+
+    try:
+        _reset(first_rpdo)
+        first_rpdo.add_variable("INTEGER64 value")
+        first_rpdo.trans_type = 1
+        first_rpdo.enabled = True
+        first_rpdo.cob_id = 0x310
+        first_rpdo.save()
         first_rpdo["INTEGER64 value"].raw = 8989
-        first_rpdo.update()
-        sdo_raw = node_configured.sdo["INTEGER64 value"].raw
-        assert sdo_raw == 1_111_111 or sdo_raw == 8989
-        time.sleep(0.03)
+        first_rpdo.start(period=0.01)
+        time.sleep(0.1)
+        for i in range(100):
+            first_rpdo["INTEGER64 value"].raw = 1_111_111
+            first_rpdo.update()
+            first_rpdo["INTEGER64 value"].raw = 8989
+            first_rpdo.update()
+            time.sleep(0.03)
+    finally:
+        first_rpdo.stop()
+        first_tpdo.callbacks.remove(tpdo_receiver)
+        # Stop the event driven tpdo from flooding the bus in later tests
+        _reset(first_tpdo)
+        first_tpdo.save()
+
+    assert len(received_values) > 0
+    assert set(received_values) <= {1_111_111, 8989}
 
 
+@pytest.mark.usefixtures("savepoint")
 def test_tpdo_receive_consistency(node_configured: canopen.RemoteNode, first_tpdo: Map):
     received_bytes = []
 
@@ -143,7 +185,7 @@ def test_tpdo_receive_consistency(node_configured: canopen.RemoteNode, first_tpd
         raw_val = map["UNSIGNED64 value"].raw
         received_bytes.append(raw_val)
 
-    first_tpdo.clear()
+    _reset(first_tpdo)
     first_tpdo.add_variable("UNSIGNED64 value")
     node_configured.sdo["Communication cycle period"].raw = 1000
     node_configured.sdo["UNSIGNED64 value"].raw = 0xAA_AA_AA_AA_AA_AA_AA_A
@@ -167,8 +209,9 @@ def test_tpdo_receive_consistency(node_configured: canopen.RemoteNode, first_tpd
         )
 
 
+@pytest.mark.usefixtures("savepoint")
 def test_tpdo_transmission_type(first_tpdo: Map, node_configured: RemoteNode):
-    first_tpdo.clear()
+    _reset(first_tpdo)
     first_tpdo.enabled = True
     first_tpdo.trans_type = 1
     first_tpdo.add_variable("UNSIGNED64 value")
@@ -201,8 +244,8 @@ def test_tpdo_transmission_type(first_tpdo: Map, node_configured: RemoteNode):
         timestamp = new_timestamp
 
 
-def test_tpdo_transmission_type(first_tpdo: Map):
-    first_tpdo.clear()
+def test_tpdo_inhibit_event_timer(first_tpdo: Map):
+    _reset(first_tpdo)
     first_tpdo.add_variable("UNSIGNED64 value")
     first_tpdo.enabled = True
     first_tpdo.inhibit_time = 11000
@@ -1,6 +1,8 @@
+from typing import Dict
 import pytest
 import canopen
 from canopen.objectdictionary import datatypes
+from canopen.sdo import Variable
 from canopen.sdo.client import BlockDownloadStream
 import time
 
@@ -19,80 +21,112 @@ def node(node: canopen.RemoteNode) -> canopen.RemoteNode:
     yield node
 
 
-def test_sdo_expedited_upload_download_uint8(node: canopen.RemoteNode):
+VARIABLE_NAMES = [
+    "UNSIGNED8 value",
+    "UNSIGNED16 value",
+    "UNSIGNED32 value",
+    "UNSIGNED64 value",
+    "INTEGER8 value",
+    "INTEGER16 value",
+    "INTEGER32 value",
+    "INTEGER64 value",
+    "REAL32 value",
+    "REAL64 value",
+    "VISIBLE STRING value",
+]
+
+
+# OD lookups done once per module, values are still read / written via SDO
+@pytest.fixture(scope="module")
+def variables(node: canopen.RemoteNode) -> Dict[str, Variable]:
+    return {name: node.sdo[name] for name in VARIABLE_NAMES}
+
+
+def test_sdo_expedited_upload_download_uint8(variables: Dict[str, Variable]):
+    var = variables["UNSIGNED8 value"]
+    assert var.od.data_type == datatypes.UNSIGNED8
     for value in [10, 22, 89, 253]:
-        node.sdo["UNSIGNED8 value"].raw = value
-        assert node.sdo["UNSIGNED8 value"].raw == value
-        assert node.sdo["UNSIGNED8 value"].od.data_type == datatypes.UNSIGNED8
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_uint16(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_uint16(variables: Dict[str, Variable]):
+    var = variables["UNSIGNED16 value"]
+    assert var.od.data_type == datatypes.UNSIGNED16
     for value in [0x100, 0x200, 0x8989]:
-        node.sdo["UNSIGNED16 value"].raw = value
-        assert node.sdo["UNSIGNED16 value"].raw == value
-        assert node.sdo["UNSIGNED16 value"].od.data_type == datatypes.UNSIGNED16
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_uint32(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_uint32(variables: Dict[str, Variable]):
+    var = variables["UNSIGNED32 value"]
+    assert var.od.data_type == datatypes.UNSIGNED32
     for value in [0x222222, 0x88888888, 0x56]:
-        node.sdo["UNSIGNED32 value"].raw = value
-        assert node.sdo["UNSIGNED32 value"].raw == value
-        assert node.sdo["UNSIGNED32 value"].od.data_type == datatypes.UNSIGNED32
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_segmented_upload_download_uint64(node: canopen.RemoteNode):
+def test_sdo_segmented_upload_download_uint64(variables: Dict[str, Variable]):
+    var = variables["UNSIGNED64 value"]
+    assert var.od.data_type == datatypes.UNSIGNED64
     for value in [0x222222, 0x88888888, 0x9988888899888888]:
-        node.sdo["UNSIGNED64 value"].raw = value
-        assert node.sdo["UNSIGNED64 value"].raw == value
-        assert node.sdo["UNSIGNED64 value"].od.data_type == datatypes.UNSIGNED64
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_int8(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_int8(variables: Dict[str, Variable]):
+    var = variables["INTEGER8 value"]
+    assert var.od.data_type == datatypes.INTEGER8
     for value in [-10, 50, 100]:
-        node.sdo["INTEGER8 value"].raw = value
-        assert node.sdo["INTEGER8 value"].raw == value
-        assert node.sdo["INTEGER8 value"].od.data_type == datatypes.INTEGER8
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_int16(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_int16(variables: Dict[str, Variable]):
+    var = variables["INTEGER16 value"]
+    assert var.od.data_type == datatypes.INTEGER16
     for value in [-1000, -9999, 0]:
-        node.sdo["INTEGER16 value"].raw = value
-        assert node.sdo["INTEGER16 value"].raw == value
-        assert node.sdo["INTEGER16 value"].od.data_type == datatypes.INTEGER16
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_int32(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_int32(variables: Dict[str, Variable]):
+    var = variables["INTEGER32 value"]
+    assert var.od.data_type == datatypes.INTEGER32
     for value in [-100056666, -89123743, 46512]:
-        node.sdo["INTEGER32 value"].raw = value
-        assert node.sdo["INTEGER32 value"].raw == value
-        assert node.sdo["INTEGER32 value"].od.data_type == datatypes.INTEGER32
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_segmented_upload_download_int64(node: canopen.RemoteNode):
+def test_sdo_segmented_upload_download_int64(variables: Dict[str, Variable]):
+    var = variables["INTEGER64 value"]
+    assert var.od.data_type == datatypes.INTEGER64
     for value in [0x222222, 0x88888888, 0x99888889888888]:
-        node.sdo["INTEGER64 value"].raw = value
-        assert node.sdo["INTEGER64 value"].raw == value
-        assert node.sdo["INTEGER64 value"].od.data_type == datatypes.INTEGER64
+        var.raw = value
+        assert var.raw == value
 
 
-def test_sdo_expedited_upload_download_float32(node: canopen.RemoteNode):
+def test_sdo_expedited_upload_download_float32(variables: Dict[str, Variable]):
+    var = variables["REAL32 value"]
+    assert var.od.data_type == datatypes.REAL32
     for value in [1.5, 3.4, 8952.65]:
-        node.sdo["REAL32 value"].raw = value
-        pytest.approx(node.sdo["REAL32 value"].raw) == value
-        assert node.sdo["REAL32 value"].od.data_type == datatypes.REAL32
+        var.raw = value
+        pytest.approx(var.raw) == value
 
 
-def test_sdo_segmented_upload_download_float64(node: canopen.RemoteNode):
+def test_sdo_segmented_upload_download_float64(variables: Dict[str, Variable]):
+    var = variables["REAL64 value"]
+    assert var.od.data_type == datatypes.REAL64
     for value in [1.5, 3.4, 8952.65, 3.14159]:
-        node.sdo["REAL64 value"].raw = value
-        assert pytest.approx(node.sdo["REAL64 value"].raw) == value
-        assert node.sdo["REAL64 value"].od.data_type == datatypes.REAL64
+        var.raw = value
+        assert pytest.approx(var.raw) == value
 
 
-def test_sdo_segmented_upload_download_string(node: canopen.RemoteNode):
+def test_sdo_segmented_upload_download_string(variables: Dict[str, Variable]):
+    var = variables["VISIBLE STRING value"]
     for value in ["a string value9", "anotherstring8", "tinystr"]:
-        node.sdo["VISIBLE STRING value"].raw = value
-        assert node.sdo["VISIBLE STRING value"].raw == value
+        var.raw = value
+        assert var.raw == value
 
 
 def test_sdo_segmented_force_download_upload_uint8(node: canopen.RemoteNode):
@@ -119,17 +153,17 @@ def test_sdo_access_read_write(node: canopen.RemoteNode):
 def test_sdo_wrong_size(node: canopen.RemoteNode):
     for data_type in ["UNSIGNED8", "INTEGER8"]:
         with pytest.raises(canopen.SdoAbortedError, match="parameter too high"):
-            node.sdo[f"{data_type} value"].raw = bytes([1, 2])
+            node.sdo[f"{data_type} value"].raw = b"\x01\x02"
     for data_type in ["UNSIGNED16", "INTEGER16"]:
         with pytest.raises(canopen.SdoAbortedError, match="parameter too high"):
-            node.sdo[f"{data_type} value"].raw = bytes([1, 2, 3])
+            node.sdo[f"{data_type} value"].raw = b"\x01\x02\x03"
         with pytest.raises(canopen.SdoAbortedError, match="parameter too low"):
-            node.sdo[f"{data_type} value"].raw = bytes([1])
+            node.sdo[f"{data_type} value"].raw = b"\x01"
     for data_type in ["UNSIGNED32", "INTEGER32"]:
         with pytest.raises(canopen.SdoAbortedError, match="parameter too high"):
-            node.sdo[f"{data_type} value"].raw = bytes([1, 2, 3, 4, 5])
+            node.sdo[f"{data_type} value"].raw = b"\x01\x02\x03\x04\x05"
         with pytest.raises(canopen.SdoAbortedError, match="parameter too low"):
-            node.sdo[f"{data_type} value"].raw = bytes([1, 2, 3])
+            node.sdo[f"{data_type} value"].raw = b"\x01\x02\x03"
 
 
 def test_sdo_index_not_exist(node: canopen.RemoteNode):
@@ -151,8 +185,7 @@ def test_sdo_block_download(node: canopen.RemoteNode):
         request_crc_support=True,
         size=len(LINE) * NB_LINES,
     ) as f:
-        for _ in range(NB_LINES):
-            f.write(LINE)
+        f.write(LINE * NB_LINES)
 
 
 def test_sdo_block_upload(node: canopen.RemoteNode):
@@ -173,8 +206,7 @@ def test_sdo_block_download_multi_blocks(node: canopen.RemoteNode):
         request_crc_support=True,
         size=len(LINE) * NB_LINES,
     ) as f:
-        for _ in range(NB_LINES):
-            f.write(LINE)
+        f.write(LINE * NB_LINES)
 
 
 def test_sdo_block_download_no_size(node: canopen.RemoteNode):
@@ -262,6 +294,17 @@ def test_sdo_block_download_retransmit(node: canopen.RemoteNode):
     stream.close()
 
 
+def wait_for_abort(sdo_client: canopen.sdo.SdoClient, timeout: float):
+    """Read server responses until an abort is raised or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            sdo_client.read_response()
+        except canopen.SdoCommunicationError:
+            # Nothing received yet, keep waiting
+            pass
+
+
 def test_sdo_segmented_download_timeout(node: canopen.RemoteNode):
     def mock_close():
         return None
@@ -273,10 +316,8 @@ def test_sdo_segmented_download_timeout(node: canopen.RemoteNode):
         mode="rb", block_transfer=False, request_crc_support=True
     )
     f.raw.close = mock_close
-    time.sleep(1.1)
     with pytest.raises(canopen.SdoAbortedError, match="Timeout"):
-        while True:
-            response = f.raw.sdo_client.read_response()
+        wait_for_abort(f.raw.sdo_client, timeout=3.0)
 
 
 def test_sdo_block_download_timeout(node: canopen.RemoteNode):
@@ -294,10 +335,8 @@ def test_sdo_block_download_timeout(node: canopen.RemoteNode):
         mode="wb", block_transfer=True, request_crc_support=True, size=1000
     )
     f.raw.close = mock_close
-    time.sleep(2.0)
     with pytest.raises(canopen.SdoAbortedError, match="Timeout"):
-        while True:
-            _ = f.raw.sdo_client.read_response()
+        wait_for_abort(f.raw.sdo_client, timeout=3.0)
 
 
 def test_sdo_block_upload_invalid_blksize(node: canopen.RemoteNode):
@@ -319,7 +358,9 @@ def test_sdo_block_upload_invalid_blksize(node: canopen.RemoteNode):
     BlockUploadStream.blksize = 127
 
 
-def test_sdo_block_upload_crc_invalid(node: canopen.RemoteNode):
+def test_sdo_block_upload_crc_invalid(
+    node: canopen.RemoteNode, variables: Dict[str, Variable]
+):
     from canopen.sdo.client import BlockUploadStream
 
     with pytest.raises(canopen.SdoCommunicationError, match="CRC"):
@@ -336,10 +377,11 @@ def test_sdo_block_upload_crc_invalid(node: canopen.RemoteNode):
             stream.close()
 
     # Do some dummy reads
+    var = variables["UNSIGNED8 value"]
+    assert var.od.data_type == datatypes.UNSIGNED8
     for value in [10, 22, 89, 253]:
-        node.sdo["UNSIGNED8 value"].raw = value
-        assert node.sdo["UNSIGNED8 value"].raw == value
-        assert node.sdo["UNSIGNED8 value"].od.data_type == datatypes.UNSIGNED8
+        var.raw = value
+        assert var.raw == value
 
 
 # def test_sdo_block_upload_retransmit(node: canopen.RemoteNode):
@@ -362,9 +404,7 @@ def test_sdo_block_upload_crc_invalid(node: canopen.RemoteNode):
 
 def test_sdo_block_download_upload(node: canopen.RemoteNode):
     LINE = b"this is some fake bin data\n"
-    STRING_BINARY = b""
-    for i in range(111):
-        STRING_BINARY += LINE
+    STRING_BINARY = LINE * 111
     # Write some data then read back
     with node.sdo["DOMAIN value"].open(
         mode="wb",
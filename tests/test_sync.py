@@ -5,8 +5,7 @@ import logging
 
 import pytest
 
-from .conftest import TEST_ID, EDS_PATH
-
+from .conftest import record_savepoint, restore_savepoint
 
 logger = logging.getLogger(__name__)
 
@@ -14,61 +13,73 @@ DEFAULT_SYNC_ID = 0x80
 DEFAULT_SYNC_COMM_PERIOD_MS = 1000_000
 
 
-@pytest.fixture
-def node_sync(network: canopen.Network) -> canopen.RemoteNode:
-    if TEST_ID in network:
-        del network[TEST_ID]
-    node = network.add_node(TEST_ID, EDS_PATH)
-    if DEFAULT_SYNC_ID in network.subscribers:
-        network.unsubscribe(DEFAULT_SYNC_ID)
+class FrameCounter:
+    """Network subscriber callback that counts received frames"""
+
+    def __init__(self):
+        self.value = 0
+
+    def __call__(self, *args):
+        self.value += 1
+
+
+def reset_sync(node: canopen.RemoteNode):
     # Disable the sync and default to 1 second time
     ENABLE_SYNC = 0x80 | (0 << 30)
     node.sdo["COB-ID SYNC message"].raw = ENABLE_SYNC
     node.sdo["Communication cycle period"].raw = DEFAULT_SYNC_COMM_PERIOD_MS
-    yield node
 
 
-def test_sync_communication_cycle_period(node_sync: canopen.RemoteNode):
-    global counter
-    counter = 0
+@pytest.fixture
+def node_sync(
+    savepoint: canopen.RemoteNode, network: canopen.Network
+) -> canopen.RemoteNode:
+    if DEFAULT_SYNC_ID in network.subscribers:
+        network.unsubscribe(DEFAULT_SYNC_ID)
+    # SYNC settings are restored by the savepoint fixture after the test
+    reset_sync(savepoint)
+    yield savepoint
 
-    def sync_receiver(*args):
-        global counter
-        counter += 1
 
+def test_sync_communication_cycle_period(node_sync: canopen.RemoteNode):
+    counter = FrameCounter()
     PERIOD_MS = 1000 * 1000
     node_sync.sdo["Communication cycle period"].raw = PERIOD_MS
     assert node_sync.sdo["Communication cycle period"].raw == PERIOD_MS
     ENABLE_SYNC = 0x80 | (1 << 30)
     node_sync.sdo["COB-ID SYNC message"].raw = ENABLE_SYNC
     assert node_sync.sdo["COB-ID SYNC message"].raw == ENABLE_SYNC
-    node_sync.network.subscribe(0x80, sync_receiver)
+    node_sync.network.subscribe(0x80, counter)
     time.sleep(1.2)
-    assert counter == 1
+    assert counter.value == 1
     node_sync.sdo["Communication cycle period"].raw = PERIOD_MS / 10
-    counter = 0
+    counter.value = 0
     time.sleep(1.0)
-    assert 9 <= counter <= 11
+    assert 9 <= counter.value <= 11
     node_sync.sdo["Communication cycle period"].raw = PERIOD_MS / 100
-    counter = 0
+    counter.value = 0
     time.sleep(1.0)
-    assert 90 <= counter <= 110
+    assert 90 <= counter.value <= 110
 
 
 def test_sync_change_cobid(node_sync: canopen.RemoteNode):
-    global counter
-    counter = 0
-
-    def sync_receiver(*args):
-        global counter
-        counter += 1
-
+    counter = FrameCounter()
     NEW_COB_ID = 0x91
     node_sync.sdo["COB-ID SYNC message"].raw = 1 << 30 | NEW_COB_ID
 
-    node_sync.network.subscribe(NEW_COB_ID, sync_receiver)
+    node_sync.network.subscribe(NEW_COB_ID, counter)
     time.sleep(1.2)
-    assert counter == 1
+    assert counter.value == 1
+
+
+def test_sync_change_cobid_restore(node_sync: canopen.RemoteNode):
+    node_sync.sdo["COB-ID SYNC message"].raw = 1 << 30 | 0x80
+    saved = record_savepoint(node_sync)
+    # Leave SYNC producing on another COB-ID, as test_sync_change_cobid does
+    node_sync.sdo["COB-ID SYNC message"].raw = 0x80
+    node_sync.sdo["COB-ID SYNC message"].raw = 1 << 30 | 0x91
+    restore_savepoint(node_sync, saved)
+    assert record_savepoint(node_sync) == saved
 
 
 def test_sync_change_cobid_errors(node_sync: canopen.RemoteNode):
@@ -94,12 +105,7 @@ def test_synchronous_overflow(node_sync: canopen.RemoteNode):
 
 
 def test_sync_tpdo_start_value(node_sync: canopen.RemoteNode):
-    counter = 0
-
-    def sync_receiver(*args):
-        nonlocal counter
-        counter += 1
-
+    counter = FrameCounter()
     SYNC_PERIOD_MS = 10
     node_sync.pdo.read()
     tpdo: Map = node_sync.tpdo[1]
@@ -111,30 +117,24 @@ def test_sync_tpdo_start_value(node_sync: canopen.RemoteNode):
     tpdo.save()
     # Add a callback to this tpdo
     tpdo.callbacks = []
-    tpdo.add_callback(sync_receiver)
+    tpdo.add_callback(counter)
     node_sync.sdo["COB-ID SYNC message"].raw = 1 << 30 | 0x80
     node_sync.sdo["Communication cycle period"].raw = 0
     node_sync.sdo["Synchronous counter overflow value"].raw = 200
     # Enable Sync with a period of 100ms
     node_sync.sdo["Communication cycle period"].raw = SYNC_PERIOD_MS * 1000
-    counter = 0
+    counter.value = 0
     tpdo.sync_start_value = 100  # i.e start pdo emission  after 100 syncs
     tpdo.trans_type = 1  # Send every sync
     tpdo.save()
     time.sleep(1.0)
-    assert 0 <= counter <= 10  # Should not have received anything yet
+    assert 0 <= counter.value <= 10  # Should not have received anything yet
     time.sleep(1.0)
-    assert 80 <= counter <= 120
+    assert 80 <= counter.value <= 120
 
 
 def test_sync_tpdo(node_sync: canopen.RemoteNode):
-
-    counter = 0
-
-    def sync_receiver(*args):
-        nonlocal counter
-        counter += 1
-
+    counter = FrameCounter()
     SYNC_PERIOD_MS = 100
     node_sync.pdo.read()
     # Enable Sync with a period of 100ms
@@ -150,17 +150,17 @@ def test_sync_tpdo(node_sync: canopen.RemoteNode):
     tpdo.save()
     # Add a callback to this tpdo
     tpdo.callbacks = []
-    tpdo.add_callback(sync_receiver)
-    counter = 0
+    tpdo.add_callback(counter)
+    counter.value = 0
     time.sleep(1.0)
-    assert 9 <= counter <= 11
+    assert 9 <= counter.value <= 11
     node_sync.sdo["Communication cycle period"].raw = SYNC_PERIOD_MS * 100
-    counter = 0
+    counter.value = 0
     time.sleep(1.0)
-    assert 90 <= counter <= 111
+    assert 90 <= counter.value <= 111
     # Update the transmission type
     tpdo.trans_type = 10
     tpdo.save()
-    counter = 0
+    counter.value = 0
     time.sleep(1.0)
-    assert 9 <= counter <= 11
+    assert 9 <= counter.value <= 11